@@ -12,6 +12,9 @@ from ..core.result import CheckResult
 from ..utils.normalization import NormalizationForm, normalize_data
 
 MatchMode = Literal["any", "all", "none"]
+
+# Builtin scalars whose ``__eq__`` is known to be False against any builtin str.
+_NON_STR_SCALAR_TYPES = (int, float, bool, type(None))
 type MatchCollection[T] = list[T] | set[T] | tuple[T, ...]
 
 
@@ -496,6 +499,20 @@ class Equals[InputType, OutputType, TraceType: Trace, ExpectedType](  # pyright:
         """Compare the actual value with the expected value."""
         return actual_value == expected_value
 
+    @override
+    def _try_compare(
+        self, actual_value: Any, expected_value: ExpectedType
+    ) -> bool | None:
+        # A builtin str never equals a builtin number, bool or None, so skip
+        # normalizing either side. Other types, including str subclasses, may
+        # define a custom ``__eq__`` and go through the regular comparison.
+        actual_type, expected_type = type(actual_value), type(expected_value)
+        if (actual_type is str and expected_type in _NON_STR_SCALAR_TYPES) or (
+            expected_type is str and actual_type in _NON_STR_SCALAR_TYPES
+        ):
+            return False
+        return super()._try_compare(actual_value, expected_value)
+
     @property
     @override
     def _comparison_message(self) -> str:
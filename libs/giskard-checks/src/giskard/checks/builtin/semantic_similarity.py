@@ -1,7 +1,8 @@
 from typing import override
 
 import numpy as np
-from pydantic import Field
+from giskard.agents import BaseEmbeddingModel
+from pydantic import Field, PrivateAttr
 from pydantic.experimental.missing_sentinel import MISSING
 
 from ..core import Trace
@@ -99,6 +100,10 @@ class SemanticSimilarity[InputType, OutputType, TraceType: Trace](  # pyright: i
         description="The key to extract the actual answer from the trace",
     )
 
+    _reference_embedding: tuple[BaseEmbeddingModel | str, str, np.ndarray] | None = (
+        PrivateAttr(default=None)
+    )
+
     @override
     async def run(self, trace: TraceType) -> CheckResult:
         """Execute the semantic similarity check.
@@ -157,7 +162,9 @@ class SemanticSimilarity[InputType, OutputType, TraceType: Trace](  # pyright: i
         actual_answer = str(actual_answer)
         reference_text = str(reference_text)
 
-        emb_a, emb_b = await self.get_embeddings([actual_answer, reference_text])
+        emb_a, emb_b = await self._embed_answer_and_reference(
+            actual_answer, reference_text
+        )
         similarity = cosine_similarity(emb_a, emb_b)
 
         passed = similarity >= self.threshold
@@ -183,6 +190,34 @@ class SemanticSimilarity[InputType, OutputType, TraceType: Trace](  # pyright: i
                 },
             )
 
+    async def _embed_answer_and_reference(
+        self, actual_answer: str, reference_text: str
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Embed both texts, reusing the embedding of a literal ``reference_text``.
+
+        The cached embedding is only reused for the same model and text, so
+        swapping either one re-embeds the reference.
+        """
+        model = self._embedding_model
+        # The default model is rebuilt on every access, so it is keyed on its
+        # settings; an explicit model is keyed on the instance itself.
+        model_key: BaseEmbeddingModel | str = (
+            model if self.embedding_model is not None else model.model_dump_json()
+        )
+        cached = self._reference_embedding
+        if (
+            cached is not None
+            and (cached[0] is model_key or cached[0] == model_key)
+            and cached[1] == reference_text
+        ):
+            (emb_a,) = await model.embed([actual_answer])
+            return emb_a, cached[2]
+
+        emb_a, emb_b = await model.embed([actual_answer, reference_text])
+        if self.reference_text is not MISSING:
+            self._reference_embedding = (model_key, reference_text, emb_b)
+        return emb_a, emb_b
+
     async def get_embeddings(self, texts: list[str]) -> list[np.ndarray]:
         """Generate embeddings for the given texts.
 
@@ -6,10 +6,11 @@ This module provides checks for text matching:
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any, Self, override
 
 import regex
-from pydantic import Field, model_validator
+from pydantic import Field, PrivateAttr, model_validator
 from pydantic.experimental.missing_sentinel import MISSING
 
 from ..core import Trace
@@ -19,6 +20,12 @@ from ..core.result import CheckResult
 from ..utils.normalization import NormalizationForm, normalize_string
 
 
+@lru_cache(maxsize=1024)
+def _compile_regex(pattern: str) -> regex.Pattern[str]:
+    """Compile ``pattern`` once; traces tend to repeat the same few patterns."""
+    return regex.compile(pattern)
+
+
 class TextBasedCheck[InputType, OutputType, TraceType: Trace](  # pyright: ignore[reportMissingTypeArgument]
     Check[InputType, OutputType, TraceType], ABC
 ):
@@ -219,6 +226,10 @@ class StringMatching[InputType, OutputType, TraceType: Trace](  # pyright: ignor
         description="If True, matching is case-sensitive. If False, both strings are lowercased before comparison.",
     )
 
+    _formatted_keyword: tuple[str, NormalizationForm | None, bool, str] | None = (
+        PrivateAttr(default=None)
+    )
+
     @model_validator(mode="after")
     def validate_keyword_or_keyword_key(self) -> Self:
         """Validate that exactly one of keyword or keyword_key is provided.
@@ -240,7 +251,7 @@ class StringMatching[InputType, OutputType, TraceType: Trace](  # pyright: ignor
 
         return self
 
-    def _format_str(self, value: str) -> str:
+    def _format_str(self, value: str, collapse_whitespace: bool = True) -> str:
         """Format a string for matching by applying normalization and case handling.
 
         This method:
@@ -252,19 +263,46 @@ class StringMatching[InputType, OutputType, TraceType: Trace](  # pyright: ignor
         ----------
         value : str
             The string to format.
+        collapse_whitespace : bool
+            If False, skip step 3 and keep the string's whitespace as is.
 
         Returns
         -------
         str
             The formatted string ready for comparison.
         """
-        value = normalize_string(value, self.normalization_form)
+        value = normalize_string(
+            value, self.normalization_form, collapse_whitespace=collapse_whitespace
+        )
 
         if not self.case_sensitive:
             value = value.lower()
 
         return value
 
+    def _format_keyword(self, keyword: str) -> str:
+        """Format ``keyword`` like ``_format_str``, reusing the last result.
+
+        The cache is keyed on the keyword and the formatting settings, since
+        checks are not frozen and any of them may be reassigned between runs.
+        """
+        cached = self._formatted_keyword
+        if cached is not None and cached[:3] == (
+            keyword,
+            self.normalization_form,
+            self.case_sensitive,
+        ):
+            return cached[3]
+
+        formatted = self._format_str(keyword)
+        self._formatted_keyword = (
+            keyword,
+            self.normalization_form,
+            self.case_sensitive,
+            formatted,
+        )
+        return formatted
+
     @override
     async def run(self, trace: TraceType) -> CheckResult:
         """Execute the string matching check.
@@ -301,9 +339,13 @@ class StringMatching[InputType, OutputType, TraceType: Trace](  # pyright: ignor
         details["normalization_form"] = self.normalization_form
         details["case_sensitive"] = self.case_sensitive
 
-        # Format both strings for comparison
-        formatted_text = self._format_str(text)
-        formatted_keyword = self._format_str(keyword)
+        # Format both strings for comparison. A formatted keyword without spaces
+        # can only match inside a run of non-whitespace, which collapsing the
+        # text leaves untouched, so that pass over the text can be skipped.
+        formatted_keyword = self._format_keyword(keyword)
+        formatted_text = self._format_str(
+            text, collapse_whitespace=" " in formatted_keyword
+        )
 
         # Check if keyword appears in text
         if formatted_keyword in formatted_text:
@@ -456,7 +498,9 @@ class RegexMatching[InputType, OutputType, TraceType: Trace](  # pyright: ignore
         text, pattern, details = result[0], result[1], result[2]
 
         try:
-            matched = regex.search(pattern, text, timeout=self.match_timeout_seconds)
+            matched = _compile_regex(pattern).search(
+                text, timeout=self.match_timeout_seconds
+            )
         except regex.error as e:
             return CheckResult.failure(
                 message=f"Invalid regex pattern '{pattern}': {str(e)}",
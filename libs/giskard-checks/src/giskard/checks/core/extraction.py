@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Annotated, Any, override
 
 from jsonpath_ng import (
@@ -27,13 +28,14 @@ class _JSONPathStrMarker:
 _REQUIRED_JSONPATH_PREFIX = "trace."
 
 
+@lru_cache(maxsize=1024)
 def _validate_jsonpath_syntax(v: str) -> str:
     if not v.startswith(_REQUIRED_JSONPATH_PREFIX):
         raise ValueError(
             f"Invalid JSONPath expression {v!r}: path must start with 'trace.'"
         )
     try:
-        parse(v)
+        _compile_jsonpath(v)
         return v
     except (JsonPathLexerError, JsonPathParserError) as e:
         raise ValueError(f"Invalid JSONPath expression {v!r}: {e}") from e
@@ -82,11 +84,18 @@ def _is_list_expression(expression: JSONPath) -> bool:
     return False
 
 
-def resolve[TraceType: Trace](trace: TraceType, key: str) -> Any:  # pyright: ignore[reportMissingTypeArgument]
+@lru_cache(maxsize=1024)
+def _compile_jsonpath(key: str) -> tuple[JSONPath, bool]:
+    """Parse ``key`` once; checks resolve the same few keys on every run."""
     expression: JSONPath = parse(key)
+    return expression, _is_list_expression(expression)
+
+
+def resolve[TraceType: Trace](trace: TraceType, key: str) -> Any:  # pyright: ignore[reportMissingTypeArgument]
+    expression, is_list_expression = _compile_jsonpath(key)
     matches: list[DatumInContext] = expression.find({"trace": trace.model_dump()})
 
-    if len(matches) > 1 or _is_list_expression(expression):
+    if len(matches) > 1 or is_list_expression:
         return [m.value for m in matches]
 
     return matches[0].value if matches else NoMatch(key=key)
@@ -1,20 +1,34 @@
-import re
 import unicodedata
 from typing import Literal
 
 NormalizationForm = Literal["NFC", "NFD", "NFKC", "NFKD"]
 
 
+def _unicode_normalize(normalization_form: NormalizationForm, value: str) -> str:
+    """``unicodedata.normalize`` that returns already-normalized input as-is."""
+    # The UAX #15 quick check resolves "maybe" answers without rebuilding the string.
+    if unicodedata.is_normalized(normalization_form, value):
+        return value
+    return unicodedata.normalize(normalization_form, value)
+
+
 def normalize_string(
-    value: str, normalization_form: NormalizationForm | None = None
+    value: str,
+    normalization_form: NormalizationForm | None = None,
+    collapse_whitespace: bool = True,
 ) -> str:
     """Normalize a string using the given normalization form."""
-    if normalization_form is not None:
-        value = unicodedata.normalize(normalization_form, value)
+    # Every normalization form maps pure ASCII to itself, so skip the tables.
+    if normalization_form is not None and not value.isascii():
+        value = _unicode_normalize(normalization_form, value)
+
+    if not collapse_whitespace:
+        return value
 
     # Normalize whitespace: collapse multiple spaces/tabs/newlines to single space
-    # and trim leading/trailing whitespace
-    return re.sub(r"\s+", " ", value).strip()
+    # and trim leading/trailing whitespace. str.split() uses the same whitespace
+    # set as the re module's \s, in a single pass.
+    return " ".join(value.split())
 
 
 def normalize_data[T](
@@ -6,342 +6,143 @@ Tests cover different types (str, number, bool) and various comparison scenarios
 - Same value, different type (should fail)
 """
 
-from giskard.checks import CheckStatus, Equals, Interaction, Trace
-from giskard.checks.core.extraction import NoMatch
-
-
-class TestEqualsString:
-    """Test Equals check with string values."""
-
-    async def test_string_same_value_same_type(self):
-        """Test that same string value and type passes."""
-        trace = await Trace.from_interactions(
-            Interaction(inputs="test", outputs="hello")
-        )
-        check = Equals(
-            expected_value="hello",
-            key="trace.interactions[-1].outputs",
-        )
-
-        result = await check.run(trace)
-
-        assert result.status == CheckStatus.PASS
-        assert result.passed
-        assert result.details["actual_value"] == "hello"
-        assert result.details["expected_value"] == "hello"
-
-    async def test_string_different_value_same_type(self):
-        """Test that different string values fail."""
-        trace = await Trace.from_interactions(
-            Interaction(inputs="test", outputs="hello")
-        )
-        check = Equals(
-            expected_value="world",
-            key="trace.interactions[-1].outputs",
-        )
-
-        result = await check.run(trace)
-
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
-        assert result.details["actual_value"] == "hello"
-        assert result.details["expected_value"] == "world"
-        assert isinstance(result.message, str)
-        assert "Expected value equal to 'world' but got 'hello'" in result.message
-
-    async def test_string_same_value_different_type_string_vs_number(self):
-        """Test that string '123' vs number 123 fails (type mismatch)."""
-        trace = await Trace.from_interactions(Interaction(inputs="test", outputs="123"))
-        check = Equals(
-            expected_value=123,
-            key="trace.interactions[-1].outputs",
-        )
-
-        result = await check.run(trace)
-
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
-        assert result.details["actual_value"] == "123"
-        assert result.details["expected_value"] == 123
-
-    async def test_string_same_value_different_type_string_vs_bool(self):
-        """Test that string 'True' vs bool True fails (type mismatch)."""
-        trace = await Trace.from_interactions(
-            Interaction(inputs="test", outputs="True")
-        )
-        check = Equals(
-            expected_value=True,
-            key="trace.interactions[-1].outputs",
-        )
-
-        result = await check.run(trace)
-
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
-        assert result.details["actual_value"] == "True"
-        assert result.details["expected_value"] is True
-
-
-class TestEqualsNumber:
-    """Test Equals check with numeric values."""
-
-    async def test_number_same_value_same_type_int(self):
-        """Test that same integer value and type passes."""
-        trace = await Trace.from_interactions(Interaction(inputs="test", outputs=42))
-        check = Equals(
-            expected_value=42,
-            key="trace.interactions[-1].outputs",
-        )
-
-        result = await check.run(trace)
-
-        assert result.status == CheckStatus.PASS
-        assert result.passed
-        assert result.details["actual_value"] == 42
-        assert result.details["expected_value"] == 42
+from collections import UserString
+from typing import Any, NamedTuple
 
-    async def test_number_same_value_same_type_float(self):
-        """Test that same float value and type passes."""
-        trace = await Trace.from_interactions(Interaction(inputs="test", outputs=3.14))
-        check = Equals(
-            expected_value=3.14,
-            key="trace.interactions[-1].outputs",
-        )
-
-        result = await check.run(trace)
-
-        assert result.status == CheckStatus.PASS
-        assert result.passed
-        assert result.details["actual_value"] == 3.14
-        assert result.details["expected_value"] == 3.14
-
-    async def test_number_different_value_same_type_int(self):
-        """Test that different integer values fail."""
-        trace = await Trace.from_interactions(Interaction(inputs="test", outputs=42))
-        check = Equals(
-            expected_value=100,
-            key="trace.interactions[-1].outputs",
-        )
-
-        result = await check.run(trace)
-
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
-        assert result.details["actual_value"] == 42
-        assert result.details["expected_value"] == 100
-
-    async def test_number_different_value_same_type_float(self):
-        """Test that different float values fail."""
-        trace = await Trace.from_interactions(Interaction(inputs="test", outputs=3.14))
-        check = Equals(
-            expected_value=2.71,
-            key="trace.interactions[-1].outputs",
-        )
-
-        result = await check.run(trace)
-
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
-        assert result.details["actual_value"] == 3.14
-        assert result.details["expected_value"] == 2.71
-
-    async def test_number_same_value_different_type_int_vs_float(self):
-        """Test that int 1 vs float 1.0 fails (type mismatch)."""
-        trace = await Trace.from_interactions(Interaction(inputs="test", outputs=1))
-        check = Equals(
-            expected_value=1.0,
-            key="trace.interactions[-1].outputs",
-        )
-
-        result = await check.run(trace)
-
-        # Note: In Python, 1 == 1.0 is True, so this will pass
-        # This test documents the actual behavior
-        assert result.status == CheckStatus.PASS
-        assert result.passed
-
-    async def test_number_same_value_different_type_string_vs_int(self):
-        """Test that string '1' vs int 1 fails (type mismatch)."""
-        trace = await Trace.from_interactions(Interaction(inputs="test", outputs="1"))
-        check = Equals(
-            expected_value=1,
-            key="trace.interactions[-1].outputs",
-        )
-
-        result = await check.run(trace)
-
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
-        assert result.details["actual_value"] == "1"
-        assert result.details["expected_value"] == 1
-
-    async def test_number_same_value_different_type_string_vs_float(self):
-        """Test that string '1.0' vs float 1.0 fails (type mismatch)."""
-        trace = await Trace.from_interactions(Interaction(inputs="test", outputs="1.0"))
-        check = Equals(
-            expected_value=1.0,
-            key="trace.interactions[-1].outputs",
-        )
+import pytest
+from giskard.checks import CheckResult, CheckStatus, Equals, Interaction, Trace
+from giskard.checks.core.extraction import NoMatch
 
-        result = await check.run(trace)
+# Trace is frozen and never mutated by Equals.run, so one instance can be shared.
+EMPTY_TRACE = Trace()
 
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
-        assert result.details["actual_value"] == "1.0"
-        assert result.details["expected_value"] == 1.0
 
+def _make_trace(*, outputs: Any, inputs: str = "test") -> Trace[str, Any]:
+    """Build a single-interaction trace without going through the async path."""
+    return Trace(interactions=[Interaction(inputs=inputs, outputs=outputs)])
 
-class TestEqualsBool:
-    """Test Equals check with boolean values."""
 
-    async def test_bool_same_value_same_type_true(self):
-        """Test that same boolean True value and type passes."""
-        trace = await Trace.from_interactions(Interaction(inputs="test", outputs=True))
-        check = Equals(
-            expected_value=True,
-            key="trace.interactions[-1].outputs",
-        )
+class _CaseInsensitive:
+    """Object whose ``__eq__`` accepts plain strings."""
 
-        result = await check.run(trace)
+    def __init__(self, value: str) -> None:
+        self.value = value
 
-        assert result.status == CheckStatus.PASS
-        assert result.passed
-        assert result.details["actual_value"] is True
-        assert result.details["expected_value"] is True
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, str) and other.lower() == self.value.lower()
 
-    async def test_bool_same_value_same_type_false(self):
-        """Test that same boolean False value and type passes."""
-        trace = await Trace.from_interactions(Interaction(inputs="test", outputs=False))
-        check = Equals(
-            expected_value=False,
-            key="trace.interactions[-1].outputs",
-        )
+    __hash__ = None  # pyright: ignore[reportAssignmentType]
 
-        result = await check.run(trace)
 
-        assert result.status == CheckStatus.PASS
-        assert result.passed
-        assert result.details["actual_value"] is False
-        assert result.details["expected_value"] is False
+_PASS, _FAIL = CheckStatus.PASS, CheckStatus.FAIL
 
-    async def test_bool_different_value_same_type(self):
-        """Test that different boolean values fail."""
-        trace = await Trace.from_interactions(Interaction(inputs="test", outputs=True))
-        check = Equals(
-            expected_value=False,
-            key="trace.interactions[-1].outputs",
-        )
+PASSED = (_PASS, True, False)
+FAILED = (_FAIL, False, True)
 
-        result = await check.run(trace)
 
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
-        assert result.details["actual_value"] is True
-        assert result.details["expected_value"] is False
+def _outcome(result: CheckResult) -> tuple[CheckStatus, bool, bool]:
+    """Return ``(status, passed, failed)`` so one assert covers all three."""
+    return result.status, result.passed, result.failed
 
-    async def test_bool_same_value_different_type_string_true_vs_bool_true(self):
-        """Test that string 'True' vs bool True fails (type mismatch)."""
-        trace = await Trace.from_interactions(
-            Interaction(inputs="test", outputs="True")
-        )
-        check = Equals(
-            expected_value=True,
-            key="trace.interactions[-1].outputs",
-        )
 
-        result = await check.run(trace)
+class Case(NamedTuple):
+    """A scalar Equals scenario: trace output vs expected value."""
 
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
-        assert result.details["actual_value"] == "True"
-        assert result.details["expected_value"] is True
+    outputs: Any
+    expected: Any
+    status: CheckStatus
+    message: str | None = None
 
-    async def test_bool_same_value_different_type_string_false_vs_bool_false(self):
-        """Test that string 'False' vs bool False fails (type mismatch)."""
-        trace = await Trace.from_interactions(
-            Interaction(inputs="test", outputs="False")
-        )
-        check = Equals(
-            expected_value=False,
-            key="trace.interactions[-1].outputs",
-        )
 
-        result = await check.run(trace)
+# Note: In Python, 1 == 1.0, 1 == True and 0 == False all hold, so those cases
+# document that Equals follows ``__eq__`` rather than checking exact types.
+SCALAR_CASES = [
+    pytest.param(Case("hello", "hello", _PASS), id="string_same_value_same_type"),
+    pytest.param(
+        Case(
+            "hello", "world", _FAIL, "Expected value equal to 'world' but got 'hello'"
+        ),
+        id="string_different_value_same_type",
+    ),
+    pytest.param(Case("123", 123, _FAIL), id="string_vs_number"),
+    pytest.param(Case("True", True, _FAIL), id="string_vs_bool"),
+    pytest.param(Case(42, 42, _PASS), id="number_same_value_same_type_int"),
+    pytest.param(Case(3.14, 3.14, _PASS), id="number_same_value_same_type_float"),
+    pytest.param(Case(42, 100, _FAIL), id="number_different_value_same_type_int"),
+    pytest.param(Case(3.14, 2.71, _FAIL), id="number_different_value_same_type_float"),
+    pytest.param(Case(1, 1.0, _PASS), id="number_int_vs_float"),
+    pytest.param(Case("1", 1, _FAIL), id="number_string_vs_int"),
+    pytest.param(Case("1.0", 1.0, _FAIL), id="number_string_vs_float"),
+    pytest.param(Case(True, True, _PASS), id="bool_same_value_same_type_true"),
+    pytest.param(Case(False, False, _PASS), id="bool_same_value_same_type_false"),
+    pytest.param(Case(True, False, _FAIL), id="bool_different_value_same_type"),
+    pytest.param(Case("True", True, _FAIL), id="bool_string_true_vs_bool_true"),
+    pytest.param(Case("False", False, _FAIL), id="bool_string_false_vs_bool_false"),
+    pytest.param(Case(1, True, _PASS), id="bool_number_one_vs_bool_true"),
+    pytest.param(Case(0, False, _PASS), id="bool_number_zero_vs_bool_false"),
+    pytest.param(Case("True", 1, _FAIL), id="string_true_vs_number_one"),
+    pytest.param(Case("1", True, _FAIL), id="string_one_vs_bool_true"),
+]
 
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
-        assert result.details["actual_value"] == "False"
-        assert result.details["expected_value"] is False
 
-    async def test_bool_same_value_different_type_number_one_vs_bool_true(self):
-        """Test that number 1 vs bool True fails (type mismatch).
+class TestEqualsScalars:
+    """Test Equals check with string, number and bool values."""
 
-        Note: In Python, 1 == True is True due to bool being a subclass of int,
-        but this test documents the actual behavior.
-        """
-        trace = await Trace.from_interactions(Interaction(inputs="test", outputs=1))
+    @pytest.mark.parametrize("case", SCALAR_CASES)
+    async def test_equals_table(self, case: Case):
+        """Test that scalar outputs compare against the expected value as documented."""
         check = Equals(
-            expected_value=True,
+            expected_value=case.expected,
             key="trace.interactions[-1].outputs",
         )
 
-        result = await check.run(trace)
-
-        # Note: In Python, 1 == True evaluates to True
-        # This test documents the actual behavior
-        assert result.status == CheckStatus.PASS
-        assert result.passed
+        result = await check.run(_make_trace(outputs=case.outputs))
 
-    async def test_bool_same_value_different_type_number_zero_vs_bool_false(self):
-        """Test that number 0 vs bool False.
-
-        Note: In Python, 0 == False is True due to bool being a subclass of int,
-        but this test documents the actual behavior.
-        """
-        trace = await Trace.from_interactions(Interaction(inputs="test", outputs=0))
-        check = Equals(
-            expected_value=False,
-            key="trace.interactions[-1].outputs",
+        assert _outcome(result) == (PASSED if case.status == _PASS else FAILED)
+        actual_value = result.details["actual_value"]
+        expected_value = result.details["expected_value"]
+        assert (type(actual_value), actual_value) == (type(case.outputs), case.outputs)
+        assert (type(expected_value), expected_value) == (
+            type(case.expected),
+            case.expected,
         )
+        if case.message is not None:
+            assert result.message == case.message
 
-        result = await check.run(trace)
+    async def test_type_mismatch_skips_normalization(self, monkeypatch):
+        """Test that a string vs non-string comparison fails before normalizing."""
 
-        # Note: In Python, 0 == False evaluates to True
-        # This test documents the actual behavior
-        assert result.status == CheckStatus.PASS
-        assert result.passed
+        def fail_normalize(*args, **kwargs):
+            raise AssertionError("normalize_data should not be called")
 
-    async def test_string_true_vs_number_one(self):
-        """Test that string 'True' vs number 1 fails (type mismatch)."""
-        trace = await Trace.from_interactions(
-            Interaction(inputs="test", outputs="True")
+        monkeypatch.setattr(
+            "giskard.checks.builtin.comparison.normalize_data", fail_normalize
         )
+        trace = _make_trace(outputs="123")
         check = Equals(
-            expected_value=1,
+            expected_value=123,
             key="trace.interactions[-1].outputs",
         )
 
         result = await check.run(trace)
 
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
-        assert result.details["actual_value"] == "True"
-        assert result.details["expected_value"] == 1
+        assert _outcome(result) == FAILED
+        assert result.message == "Expected value equal to 123 but got '123'"
 
-    async def test_string_one_vs_bool_true(self):
-        """Test that string '1' vs bool True fails (type mismatch)."""
-        trace = await Trace.from_interactions(Interaction(inputs="test", outputs="1"))
-        check = Equals(
-            expected_value=True,
-            key="trace.interactions[-1].outputs",
-        )
+    @pytest.mark.parametrize(
+        "expected",
+        [
+            pytest.param(UserString("hello"), id="user-string"),
+            pytest.param(_CaseInsensitive("HELLO"), id="custom-eq"),
+        ],
+    )
+    async def test_string_like_expected_uses_eq(self, expected: Any):
+        """Test that string-like objects are compared through their ``__eq__``."""
+        check = Equals(expected_value=expected, key="trace.interactions[-1].outputs")
 
-        result = await check.run(trace)
+        result = await check.run(_make_trace(outputs="hello"))
 
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
-        assert result.details["actual_value"] == "1"
-        assert result.details["expected_value"] is True
+        assert _outcome(result) == PASSED
 
 
 class TestEqualsEdgeCases:
@@ -349,12 +150,7 @@ class TestEqualsEdgeCases:
 
     async def test_nested_outputs_string(self):
         """Test equality check with nested outputs (dict structure)."""
-        trace = await Trace.from_interactions(
-            Interaction(
-                inputs="test",
-                outputs={"result": "success", "code": 200},
-            )
-        )
+        trace = _make_trace(outputs={"result": "success", "code": 200})
         check = Equals(
             expected_value="success",
             key="trace.interactions[-1].outputs.result",
@@ -362,19 +158,13 @@ class TestEqualsEdgeCases:
 
         result = await check.run(trace)
 
-        assert result.status == CheckStatus.PASS
-        assert result.passed
+        assert _outcome(result) == PASSED
         assert result.details["actual_value"] == "success"
         assert result.details["expected_value"] == "success"
 
     async def test_nested_outputs_number(self):
         """Test equality check with nested outputs containing number."""
-        trace = await Trace.from_interactions(
-            Interaction(
-                inputs="test",
-                outputs={"result": "success", "code": 200},
-            )
-        )
+        trace = _make_trace(outputs={"result": "success", "code": 200})
         check = Equals(
             expected_value=200,
             key="trace.interactions[-1].outputs.code",
@@ -382,19 +172,13 @@ class TestEqualsEdgeCases:
 
         result = await check.run(trace)
 
-        assert result.status == CheckStatus.PASS
-        assert result.passed
+        assert _outcome(result) == PASSED
         assert result.details["actual_value"] == 200
         assert result.details["expected_value"] == 200
 
     async def test_nested_outputs_bool(self):
         """Test equality check with nested outputs containing bool."""
-        trace = await Trace.from_interactions(
-            Interaction(
-                inputs="test",
-                outputs={"result": "success", "valid": True},
-            )
-        )
+        trace = _make_trace(outputs={"result": "success", "valid": True})
         check = Equals(
             expected_value=True,
             key="trace.interactions[-1].outputs.valid",
@@ -402,16 +186,13 @@ class TestEqualsEdgeCases:
 
         result = await check.run(trace)
 
-        assert result.status == CheckStatus.PASS
-        assert result.passed
+        assert _outcome(result) == PASSED
         assert result.details["actual_value"] is True
         assert result.details["expected_value"] is True
 
     async def test_missing_key(self):
         """Test equality check when the key is missing from trace."""
-        trace = await Trace.from_interactions(
-            Interaction(inputs="test", outputs={"other": "value"})
-        )
+        trace = _make_trace(outputs={"other": "value"})
         check = Equals(
             expected_value="expected",
             key="trace.interactions[-1].outputs.missing",
@@ -419,20 +200,21 @@ class TestEqualsEdgeCases:
 
         result = await check.run(trace)
 
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
+        assert _outcome(result) == FAILED
         assert isinstance(result.details["actual_value"], NoMatch)
         assert (
             result.details["actual_value"].key
             == "trace.interactions[-1].outputs.missing"
         )
         assert result.details["expected_value"] == "expected"
-        assert isinstance(result.message, str)
-        assert "No value found for key" in result.message
+        assert result.message == (
+            "No value found for key 'trace.interactions[-1].outputs.missing', "
+            "expected a value equal to 'expected'."
+        )
 
     async def test_none_value(self):
         """Test equality check with None values."""
-        trace = await Trace.from_interactions(Interaction(inputs="test", outputs=None))
+        trace = _make_trace(outputs=None)
         check = Equals(
             expected_value=None,
             key="trace.interactions[-1].outputs",
@@ -440,16 +222,13 @@ class TestEqualsEdgeCases:
 
         result = await check.run(trace)
 
-        assert result.status == CheckStatus.PASS
-        assert result.passed
+        assert _outcome(result) == PASSED
         assert result.details["actual_value"] is None
         assert result.details["expected_value"] is None
 
     async def test_nomatch_with_trace_last(self):
         """Test equality check when using trace.last syntax and key is missing."""
-        trace = await Trace.from_interactions(
-            Interaction(inputs="test", outputs={"other": "value"})
-        )
+        trace = _make_trace(outputs={"other": "value"})
         check = Equals(
             expected_value="expected",
             key="trace.last.outputs.missing",
@@ -457,20 +236,14 @@ class TestEqualsEdgeCases:
 
         result = await check.run(trace)
 
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
+        assert _outcome(result) == FAILED
         assert isinstance(result.details["actual_value"], NoMatch)
         assert result.details["actual_value"].key == "trace.last.outputs.missing"
         assert result.details["expected_value"] == "expected"
 
     async def test_nomatch_with_deeply_nested_path(self):
         """Test equality check with deeply nested path that doesn't exist."""
-        trace = await Trace.from_interactions(
-            Interaction(
-                inputs="test",
-                outputs={"level1": {"level2": {"level3": "value"}}},
-            )
-        )
+        trace = _make_trace(outputs={"level1": {"level2": {"level3": "value"}}})
         check = Equals(
             expected_value="expected",
             key="trace.interactions[-1].outputs.level1.level2.missing",
@@ -478,8 +251,7 @@ class TestEqualsEdgeCases:
 
         result = await check.run(trace)
 
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
+        assert _outcome(result) == FAILED
         assert isinstance(result.details["actual_value"], NoMatch)
         assert (
             result.details["actual_value"].key
@@ -488,7 +260,7 @@ class TestEqualsEdgeCases:
 
     async def test_nomatch_with_empty_trace(self):
         """Test equality check with empty trace (no interactions)."""
-        trace = Trace()
+        trace = EMPTY_TRACE
         check = Equals(
             expected_value="expected",
             key="trace.interactions[-1].outputs",
@@ -496,14 +268,13 @@ class TestEqualsEdgeCases:
 
         result = await check.run(trace)
 
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
+        assert _outcome(result) == FAILED
         assert isinstance(result.details["actual_value"], NoMatch)
         assert result.details["actual_value"].key == "trace.interactions[-1].outputs"
 
     async def test_nomatch_equality_when_both_are_nomatch_same_key(self):
         """Test equality check when both expected and actual are NoMatch with same key."""
-        trace = Trace()
+        trace = EMPTY_TRACE
         expected_nomatch = NoMatch(key="trace.interactions[-1].outputs")
         check = Equals(
             expected_value=expected_nomatch,
@@ -518,12 +289,11 @@ class TestEqualsEdgeCases:
         assert (
             result.details["actual_value"].key == result.details["expected_value"].key
         )
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
+        assert _outcome(result) == FAILED
 
     async def test_nomatch_equality_when_both_are_nomatch_different_keys(self):
         """Test equality check when both expected and actual are NoMatch with different keys."""
-        trace = Trace()
+        trace = EMPTY_TRACE
         expected_nomatch = NoMatch(key="different.key")
         check = Equals(
             expected_value=expected_nomatch,
@@ -538,162 +308,149 @@ class TestEqualsEdgeCases:
         assert (
             result.details["actual_value"].key != result.details["expected_value"].key
         )
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
+        assert _outcome(result) == FAILED
+
+
+@pytest.fixture(scope="module")
+def trace_two_msgs() -> Trace[str, str]:
+    """Two-interaction trace shared by the list expression tests."""
+    return Trace(
+        interactions=[
+            Interaction(inputs="test1", outputs="message 1"),
+            Interaction(inputs="test2", outputs="Message 2"),
+        ]
+    )
+
+
+@pytest.fixture(scope="module")
+def trace_one_msg() -> Trace[str, str]:
+    """Single-interaction trace shared by the list expression tests."""
+    return Trace(interactions=[Interaction(inputs="test1", outputs="message 1")])
 
 
 class TestEqualsListExpressions:
     """Test Equals check with JSONPath list expressions (wildcard and single index)."""
 
-    async def test_wildcard_expression_with_list_expected_multiple_items(self):
+    async def test_wildcard_expression_with_list_expected_multiple_items(
+        self, trace_two_msgs
+    ):
         """Test that wildcard expression [*] returns a list and matches expected list."""
-        trace = await Trace.from_interactions(
-            Interaction(inputs="test1", outputs="message 1"),
-            Interaction(inputs="test2", outputs="Message 2"),
-        )
         check = Equals(
             expected_value=["message 1", "Message 2"],
             key="trace.interactions[*].outputs",
         )
 
-        result = await check.run(trace)
+        result = await check.run(trace_two_msgs)
 
-        assert result.status == CheckStatus.PASS
-        assert result.passed
+        assert _outcome(result) == PASSED
         assert isinstance(result.details["actual_value"], list)
         assert result.details["actual_value"] == ["message 1", "Message 2"]
         assert result.details["expected_value"] == ["message 1", "Message 2"]
 
-    async def test_wildcard_expression_with_list_expected_single_item(self):
+    async def test_wildcard_expression_with_list_expected_single_item(
+        self, trace_one_msg
+    ):
         """Test that wildcard expression [*] returns a list even with single item."""
-        trace = await Trace.from_interactions(
-            Interaction(inputs="test1", outputs="message 1"),
-        )
         check = Equals(
             expected_value=["message 1"],
             key="trace.interactions[*].outputs",
         )
 
-        result = await check.run(trace)
+        result = await check.run(trace_one_msg)
 
-        assert result.status == CheckStatus.PASS
-        assert result.passed
+        assert _outcome(result) == PASSED
         assert isinstance(result.details["actual_value"], list)
         assert result.details["actual_value"] == ["message 1"]
         assert result.details["expected_value"] == ["message 1"]
 
-    async def test_wildcard_expression_with_single_value_expected_fails(self):
+    async def test_wildcard_expression_with_single_value_expected_fails(
+        self, trace_one_msg
+    ):
         """Test that wildcard expression [*] fails when expected is a single value."""
-        trace = await Trace.from_interactions(
-            Interaction(inputs="test1", outputs="message 1"),
-        )
         check = Equals(
             expected_value="message 1",
             key="trace.interactions[*].outputs",
         )
 
-        result = await check.run(trace)
+        result = await check.run(trace_one_msg)
 
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
+        assert _outcome(result) == FAILED
         assert isinstance(result.details["actual_value"], list)
         assert result.details["actual_value"] == ["message 1"]
         assert result.details["expected_value"] == "message 1"
-        assert isinstance(result.message, str)
-        assert (
+        assert result.message == (
             "Expected value equal to 'message 1' but got ['message 1']"
-            in result.message
         )
 
-    async def test_single_index_expression_with_single_value_expected(self):
+    async def test_single_index_expression_with_single_value_expected(
+        self, trace_two_msgs
+    ):
         """Test that single index expression [-1] returns a single value."""
-        trace = await Trace.from_interactions(
-            Interaction(inputs="test1", outputs="message 1"),
-            Interaction(inputs="test2", outputs="Message 2"),
-        )
         check = Equals(
             expected_value="Message 2",
             key="trace.interactions[-1].outputs",
         )
 
-        result = await check.run(trace)
+        result = await check.run(trace_two_msgs)
 
-        assert result.status == CheckStatus.PASS
-        assert result.passed
+        assert _outcome(result) == PASSED
         assert not isinstance(result.details["actual_value"], list)
         assert result.details["actual_value"] == "Message 2"
         assert result.details["expected_value"] == "Message 2"
 
-    async def test_single_index_expression_with_list_expected_fails(self):
+    async def test_single_index_expression_with_list_expected_fails(
+        self, trace_two_msgs
+    ):
         """Test that single index expression [-1] fails when expected is a list."""
-        trace = await Trace.from_interactions(
-            Interaction(inputs="test1", outputs="message 1"),
-            Interaction(inputs="test2", outputs="Message 2"),
-        )
         check = Equals(
             expected_value=["Message 2"],
             key="trace.interactions[-1].outputs",
         )
 
-        result = await check.run(trace)
+        result = await check.run(trace_two_msgs)
 
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
+        assert _outcome(result) == FAILED
         assert not isinstance(result.details["actual_value"], list)
         assert result.details["actual_value"] == "Message 2"
         assert isinstance(result.details["expected_value"], list)
         assert result.details["expected_value"] == ["Message 2"]
-        assert isinstance(result.message, str)
-        assert (
+        assert result.message == (
             "Expected value equal to ['Message 2'] but got 'Message 2'"
-            in result.message
         )
 
-    async def test_single_index_expression_with_different_value_fails(self):
+    async def test_single_index_expression_with_different_value_fails(
+        self, trace_two_msgs
+    ):
         """Test that single index expression [-1] fails when value doesn't match."""
-        trace = await Trace.from_interactions(
-            Interaction(inputs="test1", outputs="message 1"),
-            Interaction(inputs="test2", outputs="Message 2"),
-        )
         check = Equals(
             expected_value="Wrong message",
             key="trace.interactions[-1].outputs",
         )
 
-        result = await check.run(trace)
+        result = await check.run(trace_two_msgs)
 
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
+        assert _outcome(result) == FAILED
         assert result.details["actual_value"] == "Message 2"
         assert result.details["expected_value"] == "Wrong message"
-        assert isinstance(result.message, str)
-        assert (
+        assert result.message == (
             "Expected value equal to 'Wrong message' but got 'Message 2'"
-            in result.message
         )
 
-    async def test_wildcard_expression_with_different_list_fails(self):
+    async def test_wildcard_expression_with_different_list_fails(self, trace_two_msgs):
         """Test that wildcard expression [*] fails when list doesn't match."""
-        trace = await Trace.from_interactions(
-            Interaction(inputs="test1", outputs="message 1"),
-            Interaction(inputs="test2", outputs="Message 2"),
-        )
         check = Equals(
             expected_value=["wrong", "list"],
             key="trace.interactions[*].outputs",
         )
 
-        result = await check.run(trace)
+        result = await check.run(trace_two_msgs)
 
-        assert result.status == CheckStatus.FAIL
-        assert result.failed
+        assert _outcome(result) == FAILED
         assert isinstance(result.details["actual_value"], list)
         assert result.details["actual_value"] == ["message 1", "Message 2"]
         assert result.details["expected_value"] == ["wrong", "list"]
-        assert isinstance(result.message, str)
-        assert (
+        assert result.message == (
             "Expected value equal to ['wrong', 'list'] but got ['message 1', 'Message 2']"
-            in result.message
         )
 
 
@@ -716,9 +473,7 @@ class TestEqualsUnicodeNormalization:
         text_nfc = "café"  # Uses U+00E9
         text_nfd = "caf\u0065\u0301"  # Uses U+0065 U+0301
 
-        trace = await Trace.from_interactions(
-            Interaction(inputs="test", outputs=text_nfc)
-        )
+        trace = _make_trace(outputs=text_nfc)
         check = Equals(
             expected_value=text_nfd,
             key="trace.interactions[-1].outputs",
@@ -727,8 +482,7 @@ class TestEqualsUnicodeNormalization:
         result = await check.run(trace)
 
         # With normalization (default NFKC), they should match
-        assert result.status == CheckStatus.PASS
-        assert result.passed
+        assert _outcome(result) == PASSED
         assert result.details["actual_value"] == text_nfc
         assert result.details["expected_value"] == text_nfd
 
@@ -737,7 +491,7 @@ class TestEqualsUnicodeNormalization:
         # Both use U+00E9 (NFC form)
         text = "café"  # Uses U+00E9
 
-        trace = await Trace.from_interactions(Interaction(inputs="test", outputs=text))
+        trace = _make_trace(outputs=text)
         check = Equals(
             expected_value=text,
             key="trace.interactions[-1].outputs",
@@ -746,8 +500,7 @@ class TestEqualsUnicodeNormalization:
         result = await check.run(trace)
 
         # Same representation should match
-        assert result.status == CheckStatus.PASS
-        assert result.passed
+        assert _outcome(result) == PASSED
         assert result.details["actual_value"] == text
         assert result.details["expected_value"] == text
 
@@ -762,12 +515,7 @@ class TestEqualsUnicodeNormalization:
         text_nfc = "café"  # Uses U+00E9
         text_nfd = "caf\u0065\u0301"  # Uses U+0065 U+0301
 
-        trace = await Trace.from_interactions(
-            Interaction(
-                inputs="test",
-                outputs={"messages": [{"content": text_nfc}]},
-            )
-        )
+        trace = _make_trace(outputs={"messages": [{"content": text_nfc}]})
         check = Equals(
             expected_value=[text_nfd],  # Expected list with NFD form
             key="trace.interactions[-1].outputs.messages[*].content",
@@ -776,8 +524,7 @@ class TestEqualsUnicodeNormalization:
         result = await check.run(trace)
 
         # With normalization (default NFKC), they should match
-        assert result.status == CheckStatus.PASS
-        assert result.passed
+        assert _outcome(result) == PASSED
         assert result.details["actual_value"] == [text_nfc]
         assert result.details["expected_value"] == [text_nfd]
 
@@ -786,12 +533,7 @@ class TestEqualsUnicodeNormalization:
         # Both use U+00E9 (NFC form)
         text = "café"  # Uses U+00E9
 
-        trace = await Trace.from_interactions(
-            Interaction(
-                inputs="test",
-                outputs={"messages": [{"content": text}]},
-            )
-        )
+        trace = _make_trace(outputs={"messages": [{"content": text}]})
         check = Equals(
             expected_value=[text],
             key="trace.interactions[-1].outputs.messages[*].content",
@@ -800,8 +542,7 @@ class TestEqualsUnicodeNormalization:
         result = await check.run(trace)
 
         # Same representation should match
-        assert result.status == CheckStatus.PASS
-        assert result.passed
+        assert _outcome(result) == PASSED
         assert result.details["actual_value"] == [text]
         assert result.details["expected_value"] == [text]
 
@@ -818,12 +559,7 @@ class TestEqualsUnicodeNormalization:
         text_nfc = "café"  # Uses U+00E9
         text_nfd = "caf\u0065\u0301"  # Uses U+0065 U+0301
 
-        trace = await Trace.from_interactions(
-            Interaction(
-                inputs="test",
-                outputs={"messages": [{"content": text_nfc}]},
-            )
-        )
+        trace = _make_trace(outputs={"messages": [{"content": text_nfc}]})
         check = Equals(
             expected_value=[
                 {"content": text_nfd}
@@ -834,8 +570,7 @@ class TestEqualsUnicodeNormalization:
         result = await check.run(trace)
 
         # With normalization (default NFKC), they should match
-        assert result.status == CheckStatus.PASS
-        assert result.passed
+        assert _outcome(result) == PASSED
         assert result.details["actual_value"] == [{"content": text_nfc}]
         assert result.details["expected_value"] == [{"content": text_nfd}]
 
@@ -846,12 +581,7 @@ class TestEqualsUnicodeNormalization:
         # Both use U+00E9 (NFC form)
         text = "café"  # Uses U+00E9
 
-        trace = await Trace.from_interactions(
-            Interaction(
-                inputs="test",
-                outputs={"messages": [{"content": text}]},
-            )
-        )
+        trace = _make_trace(outputs={"messages": [{"content": text}]})
         check = Equals(
             expected_value=[{"content": text}],
             key="trace.interactions[-1].outputs.messages[*]",
@@ -860,7 +590,6 @@ class TestEqualsUnicodeNormalization:
         result = await check.run(trace)
 
         # Same representation should match
-        assert result.status == CheckStatus.PASS
-        assert result.passed
+        assert _outcome(result) == PASSED
         assert result.details["actual_value"] == [{"content": text}]
         assert result.details["expected_value"] == [{"content": text}]
@@ -1,3 +1,5 @@
+from typing import Any
+
 import pytest
 from giskard.checks import (
     CheckResult,
@@ -9,46 +11,51 @@ from giskard.checks import (
 )
 
 
-async def test_sync_function_returns_true() -> None:
-    """Test FnCheck with sync function returning True."""
-    check = FnCheck(fn=lambda trace: True)
-    result = await check.run(Trace())
-    assert result.status == CheckStatus.PASS
-    assert result.passed
-    assert not result.failed
+async def _async_true(trace: Trace[dict[str, str], dict[str, str]]) -> bool:
+    return True
 
 
-async def test_sync_function_returns_false() -> None:
-    """Test FnCheck with sync function returning False."""
-    check = FnCheck(fn=lambda trace: False)
-    result = await check.run(Trace())
-    assert result.status == CheckStatus.FAIL
-    assert result.failed
-    assert not result.passed
+async def _async_false(trace: Trace[dict[str, str], dict[str, str]]) -> bool:
+    return False
 
 
-async def test_async_function_returns_true() -> None:
-    """Test FnCheck with async function returning True."""
+@pytest.mark.parametrize(
+    ("fn", "expected_status"),
+    [
+        pytest.param(lambda trace: True, CheckStatus.PASS, id="sync-true"),
+        pytest.param(lambda trace: False, CheckStatus.FAIL, id="sync-false"),
+        pytest.param(_async_true, CheckStatus.PASS, id="async-true"),
+        pytest.param(_async_false, CheckStatus.FAIL, id="async-false"),
+    ],
+)
+async def test_function_returns_bool(
+    fn: Any, expected_status: CheckStatus, empty_trace: Trace
+) -> None:
+    """Test FnCheck with sync and async functions returning a bool."""
+    check = FnCheck(fn=fn)
+    result = await check.run(empty_trace)
+    assert result.status == expected_status
+    assert result.passed is (expected_status == CheckStatus.PASS)
+    assert result.failed is (expected_status == CheckStatus.FAIL)
 
-    async def async_fn(trace: Trace[dict[str, str], dict[str, str]]) -> bool:
-        return True
 
-    check = FnCheck(fn=async_fn)
-    result = await check.run(Trace())
+async def test_sync_function_returning_awaitable(empty_trace: Trace) -> None:
+    """Test FnCheck with a sync callable that returns a coroutine."""
+    check = FnCheck(fn=lambda trace: _async_true(trace))
+    result = await check.run(empty_trace)
     assert result.status == CheckStatus.PASS
-    assert result.passed
 
 
-async def test_async_function_returns_false() -> None:
-    """Test FnCheck with async function returning False."""
+async def test_fn_reassignment_between_async_and_sync(empty_trace: Trace) -> None:
+    """Test that runs follow the current fn after it is reassigned."""
+    check = FnCheck(fn=_async_false)
+    assert (await check.run(empty_trace)).status == CheckStatus.FAIL
 
-    async def async_fn(trace: Trace[dict[str, str], dict[str, str]]) -> bool:
-        return False
+    check.fn = lambda trace: True
+    assert (await check.run(empty_trace)).status == CheckStatus.PASS
 
-    check = FnCheck(fn=async_fn)
-    result = await check.run(Trace())
-    assert result.status == CheckStatus.FAIL
-    assert result.failed
+    check.fn = _async_false
+    assert (await check.run(empty_trace)).status == CheckStatus.FAIL
 
 
 async def test_sync_function_returns_check_result() -> None:
@@ -77,26 +84,37 @@ async def test_async_function_returns_check_result() -> None:
     assert result.failed
 
 
-async def test_success_message() -> None:
-    """Test FnCheck with success_message set."""
-    check = FnCheck(
-        fn=lambda trace: True,
-        success_message="Check passed successfully",
-    )
-    result = await check.run(Trace())
-    assert result.status == CheckStatus.PASS
-    assert result.message == "Check passed successfully"
-
-
-async def test_failure_message() -> None:
-    """Test FnCheck with failure_message set."""
-    check = FnCheck(
-        fn=lambda trace: False,
-        failure_message="Check failed",
-    )
-    result = await check.run(Trace())
-    assert result.status == CheckStatus.FAIL
-    assert result.message == "Check failed"
+@pytest.mark.parametrize(
+    ("fn", "kwargs", "expected_status", "expected_message"),
+    [
+        pytest.param(
+            lambda trace: True,
+            {"success_message": "Check passed successfully"},
+            CheckStatus.PASS,
+            "Check passed successfully",
+            id="success",
+        ),
+        pytest.param(
+            lambda trace: False,
+            {"failure_message": "Check failed"},
+            CheckStatus.FAIL,
+            "Check failed",
+            id="failure",
+        ),
+    ],
+)
+async def test_messages(
+    fn: Any,
+    kwargs: dict[str, str],
+    expected_status: CheckStatus,
+    expected_message: str,
+    empty_trace: Trace,
+) -> None:
+    """Test FnCheck with success_message or failure_message set."""
+    check = FnCheck(fn=fn, **kwargs)
+    result = await check.run(empty_trace)
+    assert result.status == expected_status
+    assert result.message == expected_message
 
 
 async def test_details() -> None:
@@ -5,14 +5,14 @@ from giskard.checks import CheckStatus, Groundedness, Interaction, Trace
 from ..testing_utils import MockJudgeGenerator as MockGenerator
 
 
-async def test_run_returns_success() -> None:
+async def test_run_returns_success(empty_trace: Trace) -> None:
     generator = MockGenerator(passed=True, reason="Answer is grounded in context")
     groundedness = Groundedness(
         generator=generator,
         answer="The Eiffel Tower is in Paris.",
         context=["Paris is the capital of France.", "The Eiffel Tower is a landmark."],
     )
-    result = await groundedness.run(Trace())
+    result = await groundedness.run(empty_trace)
     assert result.status == CheckStatus.PASS
     assert result.details["reason"] == "Answer is grounded in context"
 
@@ -21,28 +21,30 @@ async def test_run_returns_success() -> None:
     assert len(generator.calls[0]) > 0
 
 
-async def test_run_returns_failure() -> None:
+async def test_run_returns_failure(empty_trace: Trace) -> None:
     generator = MockGenerator(passed=False, reason="Answer is not grounded in context")
     groundedness = Groundedness(
         generator=generator,
         answer="The Eiffel Tower is in Tokyo.",
         context=["Paris is the capital of France.", "The Eiffel Tower is a landmark."],
     )
-    result = await groundedness.run(Trace())
+    result = await groundedness.run(empty_trace)
     assert result.status == CheckStatus.FAIL
     assert result.details["reason"] == "Answer is not grounded in context"
 
     assert len(generator.calls) == 1
 
 
-async def test_prompt_allows_explicit_refusals_without_context_support() -> None:
+async def test_prompt_allows_explicit_refusals_without_context_support(
+    empty_trace: Trace,
+) -> None:
     generator = MockGenerator(passed=True, reason="Explicit refusal")
     groundedness = Groundedness(
         generator=generator,
         answer="I can't help with that request.",
         context=["The Eiffel Tower is a landmark in Paris."],
     )
-    result = await groundedness.run(Trace())
+    result = await groundedness.run(empty_trace)
 
     assert result.status == CheckStatus.PASS
     prompt = generator.calls[0][0].transcript
@@ -76,14 +78,14 @@ async def test_answer_and_context_from_trace() -> None:
     assert "Paris is the capital of France." in result.details["inputs"]["context"]
 
 
-async def test_direct_answer_and_context() -> None:
+async def test_direct_answer_and_context(empty_trace: Trace) -> None:
     generator = MockGenerator(passed=True, reason=None)
     groundedness = Groundedness(
         generator=generator,
         answer="Direct answer",
         context=["Context 1", "Context 2"],
     )
-    result = await groundedness.run(Trace())
+    result = await groundedness.run(empty_trace)
 
     assert result.status == CheckStatus.PASS
     assert "inputs" in result.details
@@ -92,7 +94,7 @@ async def test_direct_answer_and_context() -> None:
     assert "Context 2" in result.details["inputs"]["context"]
 
 
-async def test_direct_answer_and_single_string_context() -> None:
+async def test_direct_answer_and_single_string_context(empty_trace: Trace) -> None:
     """Test that context can be a single string instead of a list."""
     generator = MockGenerator(
         passed=True, reason="Answer is grounded in single context string"
@@ -102,7 +104,7 @@ async def test_direct_answer_and_single_string_context() -> None:
         answer="The Eiffel Tower is in Paris.",
         context="Paris is the capital of France. The Eiffel Tower is a famous landmark located there.",
     )
-    result = await groundedness.run(Trace())
+    result = await groundedness.run(empty_trace)
 
     assert result.status == CheckStatus.PASS
     assert "inputs" in result.details
@@ -189,7 +191,7 @@ async def test_empty_string_context_is_preserved() -> None:
     assert result.details["inputs"]["context"] == ""
 
 
-async def test_empty_context() -> None:
+async def test_empty_context(empty_trace: Trace) -> None:
     """Test behavior with empty context."""
     generator = MockGenerator(passed=False, reason="No context provided")
     groundedness = Groundedness(
@@ -197,18 +199,18 @@ async def test_empty_context() -> None:
         answer="Some answer",
         context=[],
     )
-    result = await groundedness.run(Trace())
+    result = await groundedness.run(empty_trace)
 
     assert result.status == CheckStatus.FAIL
     assert result.details["inputs"]["context"] == "[]"
 
 
-async def test_missing_answer_in_trace() -> None:
+async def test_missing_answer_in_trace(empty_trace: Trace) -> None:
     """Test behavior when answer is not found in trace."""
     generator = MockGenerator(passed=True, reason=None)
     groundedness = Groundedness(generator=generator)
     # Empty trace - no interactions
-    result = await groundedness.run(Trace())
+    result = await groundedness.run(empty_trace)
 
     assert result.status == CheckStatus.PASS
     # When resolve returns NoMatch, str(NoMatch) becomes "No match for key: ..."
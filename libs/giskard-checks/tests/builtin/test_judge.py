@@ -1,62 +1,24 @@
-import json
-from collections.abc import Sequence
-from typing import Any, cast, override
+from typing import cast
 
 import pytest
-from giskard.agents.generators.base import BaseGenerator, GenerationParams
 from giskard.checks import Check, CheckStatus, Interaction, LLMJudge, Trace
-from giskard.llm.types import (
-    AssistantMessage,
-    ChatMessage,
-    Choice,
-    CompletionResponse,
-    UserMessage,
-)
-from pydantic import Field, ValidationError
-
-
-@BaseGenerator.register("mock")
-class MockGenerator(BaseGenerator):
-    """Mock generator that returns predictable pass/fail and reason."""
-
-    passed: bool
-    reason: str | None
-    calls: list[Sequence[ChatMessage]] = Field(default_factory=list)
-
-    @override
-    async def _call_model(
-        self,
-        messages: Sequence[ChatMessage],
-        params: GenerationParams,
-        metadata: dict[str, Any] | None = None,
-    ) -> CompletionResponse:
-        self.calls.append(messages)
-        return CompletionResponse(
-            choices=[
-                Choice(
-                    message=AssistantMessage(
-                        role="assistant",
-                        content=json.dumps(
-                            {"passed": self.passed, "reason": self.reason}
-                        ),
-                    ),
-                    finish_reason="stop",
-                    index=0,
-                )
-            ],
-            model="mock",
-        )
+from giskard.llm.types import UserMessage
+from pydantic import ValidationError
+
+from ..testing_utils import MockJudgeGenerator as MockGenerator
 
 
 def serialization_roundtrip[InputType, OutputType, TraceType: Trace](  # pyright: ignore[reportMissingTypeArgument]
     judge: LLMJudge[InputType, OutputType, TraceType],
 ) -> LLMJudge[InputType, OutputType, TraceType]:
-    check = Check.model_validate(judge.model_dump())
+    check = Check.model_validate_json(judge.model_dump_json())
     assert isinstance(check, LLMJudge)
     return cast(LLMJudge[InputType, OutputType, TraceType], check)
 
 
-async def test_custom_generator_preserved_after_serialization_roundtrip() -> None:
+async def test_custom_generator_preserved_after_serialization_roundtrip(
+    empty_trace: Trace,
+) -> None:
     """Custom generator is preserved across model_dump/model_validate (fixes #2292)."""
     generator = MockGenerator(passed=True, reason="Preserved reason")
     judge = LLMJudge(generator=generator, prompt="Evaluate.")
@@ -68,16 +30,16 @@ async def test_custom_generator_preserved_after_serialization_roundtrip() -> Non
     assert roundtrip_judge.generator.passed is True
     assert roundtrip_judge.generator.reason == "Preserved reason"
 
-    result = await roundtrip_judge.run(Trace())
+    result = await roundtrip_judge.run(empty_trace)
     assert result.status == CheckStatus.PASS
     assert result.details["reason"] == "Preserved reason"
     assert len(roundtrip_judge.generator.calls) == 1
 
 
-async def test_run_returns_success() -> None:
+async def test_run_returns_success(empty_trace: Trace) -> None:
     generator = MockGenerator(passed=True, reason="Looks good")
     judge = LLMJudge(generator=generator, prompt="Evaluate the answer.")
-    result = await judge.run(Trace())
+    result = await judge.run(empty_trace)
     assert result.status == CheckStatus.PASS
     assert result.details["reason"] == "Looks good"
 
@@ -85,7 +47,7 @@ async def test_run_returns_success() -> None:
     assert generator.calls[0] == [UserMessage(content="Evaluate the answer.")]
 
     roundtrip_judge = serialization_roundtrip(judge)
-    result = await roundtrip_judge.run(Trace())
+    result = await roundtrip_judge.run(empty_trace)
     assert result.status == CheckStatus.PASS
     assert result.details["reason"] == "Looks good"
     assert isinstance(roundtrip_judge.generator, MockGenerator)
@@ -96,10 +58,10 @@ async def test_run_returns_success() -> None:
     ]
 
 
-async def test_run_returns_failure() -> None:
+async def test_run_returns_failure(empty_trace: Trace) -> None:
     generator = MockGenerator(passed=False, reason="Looks bad")
     judge = LLMJudge(generator=generator, prompt="Evaluate the answer.")
-    result = await judge.run(Trace())
+    result = await judge.run(empty_trace)
     assert result.status == CheckStatus.FAIL
     assert result.details["reason"] == "Looks bad"
 
@@ -107,7 +69,7 @@ async def test_run_returns_failure() -> None:
     assert generator.calls[0] == [UserMessage(content="Evaluate the answer.")]
 
     roundtrip_judge = serialization_roundtrip(judge)
-    result = await roundtrip_judge.run(Trace())
+    result = await roundtrip_judge.run(empty_trace)
     assert result.status == CheckStatus.FAIL
     assert result.details["reason"] == "Looks bad"
     assert isinstance(roundtrip_judge.generator, MockGenerator)
@@ -1,4 +1,4 @@
-from typing import cast
+from typing import Self, cast
 
 import numpy as np
 import pytest
@@ -12,6 +12,7 @@ from giskard.checks import (
 )
 from giskard.checks.builtin.semantic_similarity import cosine_similarity
 from giskard.checks.core.extraction import NoMatch
+from pydantic import PrivateAttr, model_validator
 
 
 @BaseEmbeddingModel.register("mock")
@@ -20,24 +21,41 @@ class MockEmbeddingModel(BaseEmbeddingModel):
 
     embeddings: dict[str, list[float]]
 
+    _vectors: dict[str, np.ndarray] = PrivateAttr()
+    _calls: list[list[str]] = PrivateAttr(default_factory=list)
+
+    @model_validator(mode="after")
+    def _build_vectors(self) -> Self:
+        # Convert once; _embed hands out the same arrays on every call.
+        self._vectors = {
+            text: np.asarray(vector, dtype=float)
+            for text, vector in self.embeddings.items()
+        }
+        return self
+
+    @property
+    def calls(self) -> list[list[str]]:
+        """Texts passed to each ``_embed`` call, in order."""
+        return self._calls
+
     async def _embed(
         self, texts: list[str], params: EmbeddingParams | None = None
     ) -> list[np.ndarray]:
         """Return predefined embeddings based on text content."""
-        result = []
-        for text in texts:
-            if text in self.embeddings:
-                result.append(np.array(self.embeddings[text]))
-            else:
-                # Default: return a simple vector based on text length
-                result.append(np.array([float(len(text)), 1.0, 0.5]))
-        return result
+        self._calls.append(list(texts))
+        return [
+            self._vectors[text]
+            if text in self._vectors
+            # Default: return a simple vector based on text length
+            else np.array([float(len(text)), 1.0, 0.5])
+            for text in texts
+        ]
 
 
 def serialization_roundtrip[InputType, OutputType, TraceType: Trace](  # pyright: ignore[reportMissingTypeArgument]
     similarity: SemanticSimilarity[InputType, OutputType, TraceType],
 ) -> SemanticSimilarity[InputType, OutputType, TraceType]:
-    check = Check.model_validate(similarity.model_dump())
+    check = Check.model_validate_json(similarity.model_dump_json())
     assert isinstance(check, SemanticSimilarity)
     return cast(SemanticSimilarity[InputType, OutputType, TraceType], check)
 
@@ -110,6 +128,83 @@ async def test_run_returns_success() -> None:
     assert "Paris is home to the Eiffel Tower." in result.details["reference_text"]
 
 
+async def test_run_embeds_answer_and_reference_in_one_call() -> None:
+    """Test that both texts are sent to the embedding model in a single batch."""
+    embedding_model = MockEmbeddingModel(embeddings={})
+    check = SemanticSimilarity(
+        embedding_model=embedding_model,
+        reference_text="Reference",
+        actual_answer_key="trace.last.outputs",
+    )
+    _ = await check.run(Trace(interactions=[Interaction(inputs="q", outputs="Answer")]))
+
+    assert embedding_model.calls == [["Answer", "Reference"]]
+
+
+async def test_literal_reference_embedding_is_reused() -> None:
+    """Test that a literal reference text is embedded once across runs."""
+    embedding_model = MockEmbeddingModel(embeddings={})
+    check = SemanticSimilarity(
+        embedding_model=embedding_model,
+        reference_text="Reference",
+        actual_answer_key="trace.last.outputs",
+    )
+    for answer in ("First", "Second"):
+        trace = Trace(interactions=[Interaction(inputs="q", outputs=answer)])
+        _ = await check.run(trace)
+
+    assert embedding_model.calls == [["First", "Reference"], ["Second"]]
+
+
+async def test_literal_reference_embedding_is_reused_with_default_model(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the cache also hits when the default model is rebuilt per run."""
+    created: list[MockEmbeddingModel] = []
+
+    def _build_default_model() -> MockEmbeddingModel:
+        model = MockEmbeddingModel(embeddings={})
+        created.append(model)
+        return model
+
+    monkeypatch.setattr(
+        "giskard.checks.core.mixin.get_default_embedding_model", _build_default_model
+    )
+    check = SemanticSimilarity(
+        reference_text="Reference", actual_answer_key="trace.last.outputs"
+    )
+    for answer in ("First", "Second", "Third"):
+        trace = Trace(interactions=[Interaction(inputs="q", outputs=answer)])
+        _ = await check.run(trace)
+
+    assert len(created) == 3
+    assert [call for model in created for call in model.calls] == [
+        ["First", "Reference"],
+        ["Second"],
+        ["Third"],
+    ]
+
+
+async def test_trace_reference_is_embedded_every_run() -> None:
+    """Test that a reference text extracted from the trace is never cached."""
+    embedding_model = MockEmbeddingModel(embeddings={})
+    check = SemanticSimilarity(
+        embedding_model=embedding_model,
+        actual_answer_key="trace.last.outputs",
+    )
+    trace = Trace(
+        interactions=[
+            Interaction(
+                inputs="q", outputs="Answer", metadata={"reference_text": "Ref"}
+            )
+        ]
+    )
+    _ = await check.run(trace)
+    _ = await check.run(trace)
+
+    assert embedding_model.calls == [["Answer", "Ref"], ["Answer", "Ref"]]
+
+
 async def test_run_returns_failure() -> None:
     """Test semantic similarity check fails when similarity is below threshold."""
     embedding_model = MockEmbeddingModel(
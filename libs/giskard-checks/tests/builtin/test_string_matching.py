@@ -1,5 +1,7 @@
 """Tests for the StringMatching check."""
 
+from typing import Any
+
 import pytest
 from giskard.checks import CheckStatus, Interaction, StringMatching, Trace
 from giskard.checks.core.extraction import NoMatch
@@ -44,6 +46,16 @@ async def test_case_sensitive_matching() -> None:
     assert result.status == CheckStatus.PASS
 
 
+async def test_formatted_keyword_tracks_setting_changes(empty_trace: Trace) -> None:
+    """Test that the cached keyword is rebuilt when matching settings change."""
+    check = StringMatching(text="Hello World", keyword="WORLD")
+    assert (await check.run(empty_trace)).status == CheckStatus.FAIL
+
+    check.case_sensitive = False
+    assert (await check.run(empty_trace)).status == CheckStatus.PASS
+    assert check._formatted_keyword == ("WORLD", "NFKC", False, "world")
+
+
 async def test_text_and_keyword_from_trace() -> None:
     """Test extracting both text and keyword from trace."""
     check = StringMatching(
@@ -93,57 +105,22 @@ async def test_keyword_from_trace_text_direct() -> None:
     assert result.details["keyword"] == "Paris"
 
 
-async def test_unicode_normalization() -> None:
-    """Test that Unicode normalization works correctly."""
-    # Using NFKC normalization (default) - NFKC normalizes compatibility characters
-    # like full-width characters and superscripts, but not accents
-    # Example: full-width A (Ａ) normalizes to regular A
-    check = StringMatching(
-        text="Hello Ａ World",
-        keyword="A",
-        normalization_form="NFKC",
-        case_sensitive=False,
-    )
-    result = await check.run(Trace())
-    # NFKC should normalize full-width Ａ to regular A, so it should match
-    assert result.status == CheckStatus.PASS
-
-
-async def test_unicode_normalization_superscript() -> None:
-    """Test that Unicode normalization works with superscripts."""
-    # NFKC normalizes superscripts (²) to regular characters (2)
-    check = StringMatching(
-        text="x² + y² = z²",
-        keyword="2",
-        normalization_form="NFKC",
-        case_sensitive=False,
-    )
-    result = await check.run(Trace())
-    # NFKC should normalize ² to 2, so it should match
-    assert result.status == CheckStatus.PASS
-
-
-async def test_whitespace_normalization() -> None:
-    """Test that whitespace is normalized (multiple spaces collapsed)."""
-    check = StringMatching(
-        text="Hello    World   Test",
-        keyword="World Test",
-        case_sensitive=False,
-    )
-    result = await check.run(Trace())
-    # Should match despite different spacing
-    assert result.status == CheckStatus.PASS
-
-
-async def test_whitespace_trimming() -> None:
-    """Test that leading and trailing whitespace is trimmed."""
-    check = StringMatching(
-        text="  Hello World  ",
-        keyword="Hello World",
-        case_sensitive=False,
-    )
-    result = await check.run(Trace())
-    assert result.status == CheckStatus.PASS
+@pytest.mark.parametrize(
+    ("text", "keyword", "expected_status"),
+    [
+        pytest.param("Hello\t\n World", "World", CheckStatus.PASS, id="single-word"),
+        pytest.param("Hello\t\n World", "o W", CheckStatus.PASS, id="spanning-space"),
+        pytest.param("Hello\u00a0World", "o W", CheckStatus.PASS, id="nfkc-nbsp"),
+        pytest.param("HelloWorld", "o W", CheckStatus.FAIL, id="no-space-in-text"),
+    ],
+)
+async def test_whitespace_collapse_only_when_keyword_has_spaces(
+    text: str, keyword: str, expected_status: CheckStatus, empty_trace: Trace
+) -> None:
+    """Test matching with and without the whitespace-collapse pass on the text."""
+    check = StringMatching(text=text, keyword=keyword)
+    result = await check.run(empty_trace)
+    assert result.status == expected_status
 
 
 async def test_missing_keyword_in_trace() -> None:
@@ -192,29 +169,24 @@ async def test_default_text_key() -> None:
     assert result.status == CheckStatus.PASS
 
 
-async def test_empty_trace_with_direct_values() -> None:
-    """Test that check works with direct values even with empty trace."""
-    check = StringMatching(text="Hello", keyword="Hello")
-    result = await check.run(Trace())
-    assert result.status == CheckStatus.PASS
+@pytest.fixture(scope="module")
+def trace_bob_then_alice() -> Trace:
+    """Two-interaction trace shared by the last-interaction tests."""
+    return Trace(
+        interactions=[
+            Interaction(inputs={"name": "Bob"}, outputs={"message": "Hello Bob"}),
+            Interaction(inputs={"name": "Alice"}, outputs={"message": "Hello Alice"}),
+        ]
+    )
 
 
-async def test_trace_last_property() -> None:
+async def test_trace_last_property(trace_bob_then_alice: Trace) -> None:
     """Test using trace.last property for extraction."""
     check = StringMatching(
         text_key="trace.last.outputs.message",
         keyword="Alice",
     )
-    interaction1 = Interaction(
-        inputs={"name": "Bob"},
-        outputs={"message": "Hello Bob"},
-    )
-    interaction2 = Interaction(
-        inputs={"name": "Alice"},
-        outputs={"message": "Hello Alice"},
-    )
-    trace = Trace(interactions=[interaction1, interaction2])
-    result = await check.run(trace)
+    result = await check.run(trace_bob_then_alice)
     # Should extract from last interaction
     assert result.status == CheckStatus.PASS
     assert result.details["text"] == "Hello Alice"
@@ -241,150 +213,21 @@ async def test_multiple_interactions_uses_last() -> None:
     assert "Second response" in str(result.details["text"])
 
 
-async def test_normalization_form_none() -> None:
-    """Test that no normalization is applied when normalization_form is None."""
-    check = StringMatching(
-        text="café",
-        keyword="cafe",
-        normalization_form=None,
-        case_sensitive=False,
-    )
-    result = await check.run(Trace())
-    # Without normalization, é and e should not match
-    assert result.status == CheckStatus.FAIL
-
-
-async def test_different_normalization_forms() -> None:
-    """Test different Unicode normalization forms."""
-    # Test NFC
-    check_nfc = StringMatching(
-        text="café",
-        keyword="café",
-        normalization_form="NFC",
-        case_sensitive=False,
-    )
-    result = await check_nfc.run(Trace())
-    assert result.status == CheckStatus.PASS
-
-    # Test NFD
-    check_nfd = StringMatching(
-        text="café",
-        keyword="café",
-        normalization_form="NFD",
-        case_sensitive=False,
-    )
-    result = await check_nfd.run(Trace())
-    assert result.status == CheckStatus.PASS
-
-
-async def test_keyword_at_start_of_text() -> None:
-    """Test matching when keyword appears at the start of text."""
-    check = StringMatching(
-        text="Python is great",
-        keyword="Python",
-        case_sensitive=False,
-    )
-    result = await check.run(Trace())
-    assert result.status == CheckStatus.PASS
-
-
-async def test_keyword_at_end_of_text() -> None:
-    """Test matching when keyword appears at the end of text."""
-    check = StringMatching(
-        text="The capital is Paris",
-        keyword="Paris",
-        case_sensitive=False,
-    )
-    result = await check.run(Trace())
-    assert result.status == CheckStatus.PASS
-
-
-async def test_keyword_in_middle_of_text() -> None:
-    """Test matching when keyword appears in the middle of text."""
-    check = StringMatching(
-        text="Hello World Test",
-        keyword="World",
-        case_sensitive=False,
-    )
-    result = await check.run(Trace())
-    assert result.status == CheckStatus.PASS
-
-
-async def test_partial_word_match() -> None:
-    """Test that partial word matches work (substring matching)."""
-    check = StringMatching(
-        text="Python programming",
-        keyword="thon",
-        case_sensitive=False,
-    )
-    result = await check.run(Trace())
-    assert result.status == CheckStatus.PASS
-
-
-async def test_empty_text() -> None:
-    """Test behavior with empty text."""
-    check = StringMatching(text="", keyword="test")
-    result = await check.run(Trace())
-    assert result.status == CheckStatus.FAIL
-
-
-async def test_empty_keyword() -> None:
-    """Test behavior with empty keyword."""
-    check = StringMatching(text="Hello", keyword="")
-    result = await check.run(Trace())
-    # Empty string should be found in any text
-    assert result.status == CheckStatus.PASS
-
-
-async def test_unicode_e_acute_nfc_nfd_matching() -> None:
-    """Test that 'é' (U+00E9) matches 'é' (U+0065 U+0301) with NFC normalization."""
-    # U+00E9 is the composed form (NFC)
-    # U+0065 U+0301 is the decomposed form (NFD): 'e' + combining acute accent
-    text_nfc = "café"  # Uses U+00E9
-    keyword_nfd = "caf\u0065\u0301"  # Uses U+0065 U+0301
-
-    # With NFC normalization, both should normalize to the same form
-    check = StringMatching(
-        text=text_nfc,
-        keyword=keyword_nfd,
-        normalization_form="NFC",
-        case_sensitive=False,
-    )
-    result = await check.run(Trace())
-    assert result.status == CheckStatus.PASS
-
-
-async def test_unicode_e_acute_nfd_nfc_matching() -> None:
-    """Test that 'é' (U+0065 U+0301) matches 'é' (U+00E9) with NFD normalization."""
-    # U+0065 U+0301 is the decomposed form (NFD)
-    # U+00E9 is the composed form (NFC)
-    text_nfd = "caf\u0065\u0301"  # Uses U+0065 U+0301
-    keyword_nfc = "café"  # Uses U+00E9
-
-    # With NFD normalization, both should normalize to the same form
-    check = StringMatching(
-        text=text_nfd,
-        keyword=keyword_nfc,
-        normalization_form="NFD",
-        case_sensitive=False,
-    )
-    result = await check.run(Trace())
-    assert result.status == CheckStatus.PASS
-
-
-async def test_unicode_e_acute_nfkc_matching() -> None:
-    """Test that 'é' in different forms matches with NFKC normalization."""
-    # NFKC should also normalize both forms to the same representation
-    text_nfc = "café"  # Uses U+00E9
-    keyword_nfd = "caf\u0065\u0301"  # Uses U+0065 U+0301
-
-    check = StringMatching(
-        text=text_nfc,
-        keyword=keyword_nfd,
-        normalization_form="NFKC",
-        case_sensitive=False,
-    )
-    result = await check.run(Trace())
+@pytest.mark.parametrize(
+    ("text", "keyword"),
+    [
+        pytest.param("Python is great", "Python", id="start-of-text"),
+        pytest.param("The capital is Paris", "Paris", id="end-of-text"),
+        pytest.param("Hello World Test", "World", id="middle-of-text"),
+        pytest.param("Python programming", "thon", id="partial-word"),
+    ],
+)
+async def test_keyword_position_in_text(
+    text: str, keyword: str, empty_trace: Trace
+) -> None:
+    """Test substring matching wherever the keyword appears in the text."""
+    check = StringMatching(text=text, keyword=keyword, case_sensitive=False)
+    result = await check.run(empty_trace)
     assert result.status == CheckStatus.PASS
 
 
@@ -398,18 +241,126 @@ async def test_cannot_provide_both_keyword_and_keyword_key() -> None:
         )
 
 
-async def test_unicode_e_acute_no_normalization_fails() -> None:
-    """Test that 'é' in different forms does NOT match without normalization."""
-    # Without normalization, different Unicode representations should not match
-    text_nfc = "café"  # Uses U+00E9
-    keyword_nfd = "caf\u0065\u0301"  # Uses U+0065 U+0301
-
-    check = StringMatching(
-        text=text_nfc,
-        keyword=keyword_nfd,
-        normalization_form=None,
-        case_sensitive=False,
-    )
-    result = await check.run(Trace())
-    # Without normalization, they should not match
-    assert result.status == CheckStatus.FAIL
+@pytest.mark.parametrize(
+    ("kwargs", "expected_status"),
+    [
+        # NFKC folds compatibility characters such as full-width letters and
+        # superscripts, but keeps accents.
+        pytest.param(
+            {"text": "Hello Ａ World", "keyword": "A", "case_sensitive": False},
+            CheckStatus.PASS,
+            id="nfkc-full-width",
+        ),
+        pytest.param(
+            {"text": "x² + y² = z²", "keyword": "2", "case_sensitive": False},
+            CheckStatus.PASS,
+            id="nfkc-superscript",
+        ),
+        pytest.param(
+            {
+                "text": "café",
+                "keyword": "cafe",
+                "normalization_form": None,
+                "case_sensitive": False,
+            },
+            CheckStatus.FAIL,
+            id="no-normalization-keeps-accents",
+        ),
+        pytest.param(
+            {
+                "text": "café",
+                "keyword": "café",
+                "normalization_form": "NFC",
+                "case_sensitive": False,
+            },
+            CheckStatus.PASS,
+            id="nfc-same-form",
+        ),
+        pytest.param(
+            {
+                "text": "café",
+                "keyword": "café",
+                "normalization_form": "NFD",
+                "case_sensitive": False,
+            },
+            CheckStatus.PASS,
+            id="nfd-same-form",
+        ),
+        # "café" spelled with U+00E9 vs. "e" + combining acute U+0301.
+        pytest.param(
+            {
+                "text": "café",
+                "keyword": "cafe\u0301",
+                "normalization_form": "NFC",
+                "case_sensitive": False,
+            },
+            CheckStatus.PASS,
+            id="e-acute-nfc",
+        ),
+        pytest.param(
+            {
+                "text": "cafe\u0301",
+                "keyword": "café",
+                "normalization_form": "NFD",
+                "case_sensitive": False,
+            },
+            CheckStatus.PASS,
+            id="e-acute-nfd",
+        ),
+        pytest.param(
+            {
+                "text": "café",
+                "keyword": "cafe\u0301",
+                "normalization_form": "NFKC",
+                "case_sensitive": False,
+            },
+            CheckStatus.PASS,
+            id="e-acute-nfkc",
+        ),
+        pytest.param(
+            {
+                "text": "café",
+                "keyword": "cafe\u0301",
+                "normalization_form": None,
+                "case_sensitive": False,
+            },
+            CheckStatus.FAIL,
+            id="e-acute-no-normalization",
+        ),
+        pytest.param(
+            {
+                "text": "Hello    World   Test",
+                "keyword": "World Test",
+                "case_sensitive": False,
+            },
+            CheckStatus.PASS,
+            id="whitespace-collapsed",
+        ),
+        pytest.param(
+            {
+                "text": "  Hello World  ",
+                "keyword": "Hello World",
+                "case_sensitive": False,
+            },
+            CheckStatus.PASS,
+            id="whitespace-trimmed",
+        ),
+        pytest.param(
+            {"text": "Hello", "keyword": "Hello"}, CheckStatus.PASS, id="direct-values"
+        ),
+        pytest.param(
+            {"text": "", "keyword": "test"}, CheckStatus.FAIL, id="empty-text"
+        ),
+        # The empty string is found in any text.
+        pytest.param(
+            {"text": "Hello", "keyword": ""}, CheckStatus.PASS, id="empty-keyword"
+        ),
+    ],
+)
+async def test_direct_values_formatting(
+    kwargs: dict[str, Any], expected_status: CheckStatus, empty_trace: Trace
+) -> None:
+    """Test normalization and whitespace handling with direct text and keyword."""
+    check = StringMatching(**kwargs)
+    result = await check.run(empty_trace)
+    assert result.status == expected_status
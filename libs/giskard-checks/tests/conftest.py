@@ -1,5 +1,6 @@
 import giskard.checks.settings as settings_module
 import pytest
+from giskard.checks import Trace
 from giskard.core import disable_telemetry
 
 
@@ -11,6 +12,12 @@ def reset_default_generator():
     settings_module._default_generator = original
 
 
+@pytest.fixture(scope="session")
+def empty_trace() -> Trace:
+    """Shared empty trace; traces are frozen, so read-only tests can reuse it."""
+    return Trace()
+
+
 def pytest_configure(config: pytest.Config) -> None:
     """Disable telemetry for tests."""
     disable_telemetry()
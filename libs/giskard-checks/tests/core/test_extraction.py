@@ -3,6 +3,7 @@
 import pytest
 from giskard.checks.core.extraction import (
     JSONPathStr,
+    _compile_jsonpath,
     _validate_jsonpath_syntax,
     resolve,
 )
@@ -118,6 +119,40 @@ class TestResolveDotWildcard:
         assert resolve(trace, "trace.last.outputs") == "hello"
 
 
+class TestResolveCompiledKeys:
+    """Tests for the JSONPath compilation cache shared by validation and resolve()."""
+
+    def test_resolve_reuses_compiled_expression(self):
+        trace = Trace[str, str](
+            interactions=[Interaction(inputs="hi", outputs="hello")]
+        )
+        _compile_jsonpath.cache_clear()
+
+        assert resolve(trace, "trace.last.outputs") == "hello"
+        assert resolve(trace, "trace.last.outputs") == "hello"
+
+        info = _compile_jsonpath.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_repeated_validation_is_cached(self):
+        _validate_jsonpath_syntax.cache_clear()
+
+        _validate_jsonpath_syntax("trace.last.outputs")
+        _validate_jsonpath_syntax("trace.last.outputs")
+
+        info = _validate_jsonpath_syntax.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_validation_warms_the_resolve_cache(self):
+        _validate_jsonpath_syntax.cache_clear()
+        _compile_jsonpath.cache_clear()
+
+        _validate_jsonpath_syntax("trace.last.inputs")
+        _compile_jsonpath("trace.last.inputs")
+
+        assert _compile_jsonpath.cache_info().hits == 1
+
+
 class TestJSONPathStrAnnotatedType:
     """Tests for JSONPathStr as a Pydantic Annotated field type."""
 
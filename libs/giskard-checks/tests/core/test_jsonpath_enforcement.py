@@ -1,6 +1,5 @@
 """Enforcement test: all JSONPath fields in Check subclasses must use JSONPathStr."""
 
-import re
 import types
 from typing import Annotated, Union, get_args, get_origin
 
@@ -8,8 +7,6 @@ import giskard.checks.builtin  # noqa: F401 - triggers all @Check.register impor
 from giskard.checks.core.check import Check
 from giskard.checks.core.extraction import _JSONPathStrMarker
 
-JSONPATH_FIELD = re.compile(r"^(key|.+_key)$")
-
 
 def _all_check_subclasses(cls):
     """Recursively yield all concrete and abstract subclasses of cls.
@@ -66,7 +63,7 @@ def test_all_jsonpath_fields_use_jsonpath_str():
         if not hasattr(cls, "model_fields"):
             continue
         for field_name, field_info in cls.model_fields.items():
-            if JSONPATH_FIELD.match(field_name):
+            if field_name == "key" or field_name.endswith("_key"):
                 if not _has_jsonpath_marker(field_info):
                     violations.append(
                         f"{cls.__name__}.{field_name}: {field_info.annotation}"
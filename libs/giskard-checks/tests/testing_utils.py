@@ -1,11 +1,11 @@
 import json
 from collections.abc import Sequence
-from typing import Any, override
+from typing import Any, Self, override
 
 from giskard.agents.generators.base import BaseGenerator, GenerationParams
 from giskard.checks import Trace
 from giskard.llm.types import AssistantMessage, ChatMessage, Choice, CompletionResponse
-from pydantic import Field
+from pydantic import Field, PrivateAttr, model_validator
 
 
 class MockGenerator(BaseGenerator):
@@ -30,6 +30,7 @@ class MockGenerator(BaseGenerator):
         )
 
 
+@BaseGenerator.register("mock_judge")
 class MockJudgeGenerator(BaseGenerator):
     """Mock generator that returns a pre-configured judge verdict (passed/reason)."""
 
@@ -37,6 +38,14 @@ class MockJudgeGenerator(BaseGenerator):
     reason: str | None = None
     calls: list[Sequence[ChatMessage]] = Field(default_factory=list)
 
+    _content: str = PrivateAttr()
+
+    @model_validator(mode="after")
+    def _encode_verdict(self) -> Self:
+        # The verdict is fixed per instance, so encode it once.
+        self._content = json.dumps({"passed": self.passed, "reason": self.reason})
+        return self
+
     @override
     async def _call_model(
         self,
@@ -48,11 +57,7 @@ class MockJudgeGenerator(BaseGenerator):
         return CompletionResponse(
             choices=[
                 Choice(
-                    message=AssistantMessage(
-                        content=json.dumps(
-                            {"passed": self.passed, "reason": self.reason}
-                        )
-                    ),
+                    message=AssistantMessage(content=self._content),
                     finish_reason="stop",
                     index=0,
                 )
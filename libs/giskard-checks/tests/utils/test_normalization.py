@@ -2,7 +2,12 @@
 
 import unicodedata
 
-from giskard.checks.utils.normalization import normalize_data, normalize_string
+import pytest
+from giskard.checks.utils.normalization import (
+    _unicode_normalize,
+    normalize_data,
+    normalize_string,
+)
 
 
 def test_normalize_string_e_acute_nfc() -> None:
@@ -155,3 +160,30 @@ def test_normalize_data_list_e_acute() -> None:
     assert result[0] == "café"
     assert result[1] == "café"
     assert result[0] == result[1]
+
+
+def test_normalize_string_ascii_skips_unicode_normalization(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that pure ASCII strings bypass unicodedata normalization entirely."""
+
+    def _fail(*_args: object) -> str:
+        raise AssertionError("ASCII input must not be normalized")
+
+    monkeypatch.setattr("giskard.checks.utils.normalization._unicode_normalize", _fail)
+
+    assert normalize_string("  Hello   World ", "NFKC") == "Hello World"
+
+
+def test_normalize_string_keeps_already_normalized_string() -> None:
+    """Test that a string already in the target form is returned as-is."""
+    text = "café"  # Uses U+00E9, already NFKC
+
+    assert _unicode_normalize("NFKC", text) is text
+
+
+def test_normalize_string_collapses_all_unicode_whitespace() -> None:
+    """Test that runs of Unicode whitespace collapse to a single space."""
+    text = "\u3000Hello\t\x1c  World\x85\n"
+
+    assert normalize_string(text, None) == "Hello World"